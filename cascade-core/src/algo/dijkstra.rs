@@ -29,7 +29,7 @@ use crate::graph::TransitGraph;
 /// and the sorted schedules of the edge.
 #[must_use]
 #[allow(clippy::cast_possible_truncation, clippy::cast_sign_loss)]
-pub(crate) fn time_dependent_dijkstra(
+pub fn time_dependent_dijkstra(
     graph: &TransitGraph,
     start: NodeIndex,
     target: Option<NodeIndex>,
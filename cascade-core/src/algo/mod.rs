@@ -2,10 +2,12 @@ pub mod dijkstra;
 #[cfg(feature = "isochrone")]
 pub mod isochrone;
 pub mod itinerary;
+pub mod od_matrix;
 pub mod path_wrappers;
 
 pub use isochrone::{bulk_isochrones, calculate_isochrone};
 pub use itinerary::detailed_itinerary;
+pub use od_matrix::od_matrix;
 pub use path_wrappers::{shortest_path_weight, single_source_shortest_path_weight};
 
 use std::cmp::Ordering;
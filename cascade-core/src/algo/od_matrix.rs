@@ -0,0 +1,54 @@
+use hashbrown::HashMap;
+use petgraph::graph::NodeIndex;
+use rayon::prelude::*;
+
+use crate::algo::dijkstra::time_dependent_dijkstra;
+use crate::graph::TransitGraph;
+use crate::prelude::SnappedPoint;
+
+/// Builds a dense row-major OD matrix between `points`: element `i * n + j` holds
+/// the weight from `points[i]` to `points[j]` mapped with `convert`,
+/// pairs without a path keep `unreachable`.
+///
+/// Only one Dijkstra search runs per distinct snapped node: points snapping to
+/// the same node share the raw weights and differ only by their snapping distance.
+pub fn od_matrix<T, F>(
+    graph: &TransitGraph,
+    points: &[SnappedPoint],
+    start_time: u32,
+    unreachable: T,
+    convert: F,
+) -> Vec<T>
+where
+    T: Copy + Send + Sync,
+    F: Fn(f64) -> T + Sync,
+{
+    let n = points.len();
+    let mut matrix = vec![unreachable; n * n];
+    if n == 0 {
+        return matrix;
+    }
+
+    // hand out each row of the matrix to the search of its snapped node
+    let mut groups: HashMap<NodeIndex, Vec<(f64, &mut [T])>> = HashMap::new();
+    for (row, source) in matrix.chunks_mut(n).zip(points) {
+        groups
+            .entry(*source.index())
+            .or_default()
+            .push((*source.distance(), row));
+    }
+
+    let groups: Vec<(NodeIndex, Vec<(f64, &mut [T])>)> = groups.into_iter().collect();
+    groups.into_par_iter().for_each(|(node, rows)| {
+        let weights = time_dependent_dijkstra(graph, node, None, start_time);
+        for (distance, row) in rows {
+            for (cell, target) in row.iter_mut().zip(points) {
+                if let Some(weight) = weights.get(target.index()) {
+                    *cell = convert(weight + distance);
+                }
+            }
+        }
+    });
+
+    matrix
+}
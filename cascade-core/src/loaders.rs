@@ -39,16 +39,27 @@ fn hhmmss_to_sec(str_val: &Column) -> Series {
         .iter()
         .map(|opt_time: Option<&str>| {
             let time = opt_time.unwrap();
-            let parts: Vec<&str> = time.split(':').collect();
-            let hours = parts[0].parse::<u32>().unwrap();
-            let minutes = parts[1].parse::<u32>().unwrap();
-            let seconds = parts[2].parse::<u32>().unwrap();
-            Some(hours * 3600 + minutes * 60 + seconds)
+            Some(parse_hhmmss(time).unwrap_or_else(|| {
+                panic!(
+                    "invalid time {time} for {}. Expected HH:MM:SS",
+                    str_val.name()
+                )
+            }))
         })
         .collect::<UInt32Chunked>()
         .into_series()
 }
 
+/// Parse `HH:MM:SS` into seconds since midnight without allocating.
+/// Hours may exceed 23 for trips running past midnight.
+fn parse_hhmmss(time: &str) -> Option<u32> {
+    let mut parts = time.split(':').map(|part| part.parse::<u32>().ok());
+    let hours = parts.next()??;
+    let minutes = parts.next()??;
+    let seconds = parts.next()??;
+    Some(hours * 3600 + minutes * 60 + seconds)
+}
+
 fn filter_by_time(df: &mut DataFrame, departure: u32, duration: u32) -> Result<DataFrame, Error> {
     // Convert time columns to seconds since midnight
     df.apply("arrival_time", hhmmss_to_sec)?;
@@ -377,6 +388,15 @@ where
 mod tests {
     use super::*;
 
+    #[test]
+    fn test_parse_hhmmss() {
+        assert_eq!(parse_hhmmss("08:05:00"), Some(29100));
+        assert_eq!(parse_hhmmss("25:00:30"), Some(90030));
+        assert_eq!(parse_hhmmss("8:05:00"), Some(29100));
+        assert_eq!(parse_hhmmss("08:05"), None);
+        assert_eq!(parse_hhmmss("08:xx:00"), None);
+    }
+
     #[test]
     fn test_add_nodes_to_graph() {
         let df = df! {
@@ -1,4 +1,3 @@
-# ruff: noqa: F401
 # type: ignore
 """
 # Cascade (in Development)
@@ -12,29 +11,54 @@ See the original [NxTransit documentation](https://nxtransit.readthedocs.io/en/l
 for an overview of the features being ported and enhanced in this version.
 """
 
-from cascade._cascade_core import (
-    PyPoint,
-    PyTransitGraph,
-    bulk_isochrones,
-    calculate_isochrone,
-    calculate_od_matrix,
-    create_graph,
-    detailed_itinerary,
-    shortest_path_weight,
-    single_source_shortest_path_weight,
-)
-from cascade.validators import validate_feed
+import importlib
+
+# public name -> module defining it, imported on first attribute access (PEP 562)
+# so that e.g. `validate_feed` does not load the compiled extension
+_LAZY_IMPORTS = {
+    "PyPoint": "cascade._cascade_core",
+    "PyTransitGraph": "cascade._cascade_core",
+    "bulk_isochrones": "cascade._cascade_core",
+    "calculate_isochrone": "cascade._cascade_core",
+    "calculate_od_matrix": "cascade._cascade_core",
+    "calculate_od_matrix_ndarray": "cascade._cascade_core",
+    "create_graph": "cascade._cascade_core",
+    "detailed_itinerary": "cascade._cascade_core",
+    "shortest_path_weight": "cascade._cascade_core",
+    "single_source_shortest_path_weight": "cascade._cascade_core",
+    "single_source_shortest_path_weight_ndarray": "cascade._cascade_core",
+    "count_reachable": "cascade.accessibility",
+    "validate_feed": "cascade.validators",
+}
 
 __all__ = [
     "PyTransitGraph",
     "PyPoint",
     "create_graph",
     "single_source_shortest_path_weight",
+    "single_source_shortest_path_weight_ndarray",
     "shortest_path_weight",
     "shortest_path",
     "calculate_od_matrix",
+    "calculate_od_matrix_ndarray",
     "validate_feed",
     "detailed_itinerary",
     "calculate_isochrone",
     "bulk_isochrones",
+    "count_reachable",
 ]
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name), name)
+    # cache on the package so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
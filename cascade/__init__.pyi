@@ -1,8 +1,19 @@
 # ruff: noqa: F401
-from typing import Dict, List
+from typing import Dict, List, Tuple
+
+import numpy as np
+import numpy.typing as npt
 
 class PyTransitGraph:
-    """Multimodal graph of transit system, implemented with `PetGraph`."""
+    """
+    Multimodal graph of transit system, implemented with `PetGraph`.
+
+    Routing functions release the GIL while they search the graph, so several
+    threads can query one graph at once. The graph stays borrowed for the whole
+    search: calling `extend_with_transit` meanwhile raises
+    ``RuntimeError: Already borrowed``. Finish or synchronize the queries
+    before extending the graph.
+    """
 
     ...
 
@@ -10,6 +21,18 @@ class PyTransitGraph:
         """Get mapping of graph raw node ids to `PyGraphNode` objects."""
         ...
 
+    cache_size: int
+    """
+    Maximum number of single source shortest path results cached by the graph.
+
+    Each result holds the weights of every reachable node, so memory grows with
+    both the cache size and the graph size. Defaults to ``0``, which disables caching.
+    Lowering the size evicts the least recently used results."""
+
+    def clear_cache(self) -> None:
+        """Drop all cached shortest path results."""
+        ...
+
     def extend_with_transit(
         self, gtfs_path: str, departure: int, duration: int, weekday: str
     ) -> None:
@@ -26,6 +49,12 @@ class PyTransitGraph:
             Time period from departure for which the graph will be loaded.
         weekday : str
             Day of the week in lowercase (e.g., 'monday').
+
+        Raises
+        ------
+        RuntimeError
+            ``Already borrowed`` if another thread is querying the graph
+            at the same time.
         """
         ...
 
@@ -108,6 +137,16 @@ def single_source_shortest_path_weight(
     """
     ...
 
+def single_source_shortest_path_weight_ndarray(
+    graph: PyTransitGraph, dep_time: int, x: float, y: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Same as :func:`single_source_shortest_path_weight`, but returns
+    ``int64`` node ids and ``float64`` weights as two aligned arrays,
+    which can be wrapped by ``pyarrow`` or ``polars`` without copying.
+    """
+    ...
+
 def shortest_path_weight(
     graph: PyTransitGraph,
     dep_time: int,
@@ -128,10 +167,21 @@ def calculate_od_matrix(
     for a given list of nodes, and departure time."""
     ...
 
+def calculate_od_matrix_ndarray(
+    graph: PyTransitGraph, points: npt.ArrayLike, dep_time: int
+) -> np.ndarray:
+    """
+    Calculates the Origin-Destination (OD) matrix for an array-like
+    of x, y coordinates with shape ``(N, 2)``, converted to ``float64``.
+    Returns a dense ``float32`` array of shape ``(N, N)``, where ``[i, j]``
+    is the travel time from ``points[i]`` to ``points[j]``.
+    Unreachable pairs are ``NaN``."""
+    ...
+
 # Python implemented functions
 # Path: cascade/validators.py
 
-def validate_feed(gtfs_path: str) -> bool:
+def validate_feed(gtfs_path: str, use_cache: bool = True) -> bool:
     """
     Validates the GTFS feed located at the specified path.
 
@@ -139,6 +189,9 @@ def validate_feed(gtfs_path: str) -> bool:
     their contents. It ensures that necessary columns are present and that
     relationships between IDs in different files are consistent. Additionally,
     it verifies the format of time columns in the stop_times.txt file.
+
+    Feeds without any errors are cached in ``~/.cache/cascade/validate.json``
+    unless ``use_cache`` is False or ``CASCADE_NO_VALIDATION_CACHE`` is set.
     """
     ...
 
@@ -182,3 +235,13 @@ def bulk_isochrones(
 ) -> str:
     "Calculate many isochrones in parallel"
     ...
+
+# Path: cascade/accessibility.py
+
+def count_reachable(
+    graph: PyTransitGraph, dep_time: int, x: float, y: float, cutoff: float
+) -> int:
+    """
+    Counts graph nodes reachable from the source point within ``cutoff`` seconds.
+    """
+    ...
@@ -0,0 +1,39 @@
+import numpy as np
+
+from cascade._cascade_core import (
+    PyTransitGraph,
+    single_source_shortest_path_weight_ndarray,
+)
+
+
+def count_reachable(
+    graph: PyTransitGraph, dep_time: int, x: float, y: float, cutoff: float
+) -> int:
+    """
+    Counts graph nodes reachable from the source point within ``cutoff`` seconds.
+
+    Parameters
+    ----------
+    graph : PyTransitGraph
+        The graph to search.
+    dep_time : int
+        The departure time in seconds since midnight.
+    x : float
+        x coordinate of the source point in EPSG 4326.
+    y : float
+        y coordinate of the source point in EPSG 4326.
+    cutoff : float
+        Maximum travel time in seconds.
+
+    Returns
+    -------
+    int
+        Number of nodes with a shortest path weight of at most ``cutoff``.
+
+    Notes
+    -----
+    Weights are reduced as a single ``numpy`` array, no Python object
+    is created per node.
+    """
+    _, weights = single_source_shortest_path_weight_ndarray(graph, dep_time, x, y)
+    return int(np.count_nonzero(weights <= cutoff))
@@ -1,22 +1,31 @@
-import inspect
 import warnings
 from functools import wraps
+from typing import Set
+
+# module qualified names of unstable functions that already emitted their warning
+_warned: Set[str] = set()
 
 
 def unstable():
-    """Decorator to mark a function as unstable."""
+    """Decorator to mark a function as unstable.
+
+    The warning is emitted on the first call only.
+    """
 
     def decorate(function):
+        name = f"{function.__module__}.{function.__qualname__}"
+
         @wraps(function)
         def wrapper(*args, **kwargs):
-            warnings.warn(
-                f"`{function.__name__}` is considered unstable.",
-                stacklevel=0,
-                category=UserWarning,
-            )
+            if name not in _warned:
+                _warned.add(name)
+                warnings.warn(
+                    f"`{function.__name__}` is considered unstable.",
+                    stacklevel=2,
+                    category=UserWarning,
+                )
             return function(*args, **kwargs)
 
-        wrapper.__signature__ = inspect.signature(function)
         return wrapper
 
     return decorate
@@ -1,6 +1,9 @@
+import contextlib
+import json
 import os
+import tempfile
 import warnings
-from typing import List
+from typing import Dict, List, Tuple
 
 from .unstable import unstable
 
@@ -11,30 +14,137 @@ try:
 except ImportError:
     polars_installed = False
 
+# columns compared across files or pattern checked, read as strings:
+# no type inference for them and join keys share a dtype in every file
+_STRING_COLUMNS = {
+    "agency.txt": ["agency_id"],
+    "stops.txt": ["stop_id"],
+    "routes.txt": ["route_id", "agency_id"],
+    "trips.txt": ["trip_id", "route_id"],
+    "stop_times.txt": ["trip_id", "stop_id", "arrival_time", "departure_time"],
+}
 
-def _validate_columns(df: pl.DataFrame, required_columns: List[str], filename: str):
-    if df.is_empty() or not all(col in df.columns for col in required_columns):
+# HH:MM:SS, hours may exceed 23 for trips running past midnight
+_TIME_PATTERN = r"^\d{2}:[0-5]\d:[0-5]\d$"
+
+# stored with every cached result, bump whenever the validation rules change
+# so feeds cached under older rules are validated again
+_VALIDATOR_VERSION = 3
+
+
+def _cache_path() -> str:
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(cache_home, "cascade", "validate.json")
+
+
+def _feed_fingerprint(gtfs_path: str, files: List[str]) -> List[list]:
+    # modification time and size of every file, a change in any of them
+    # invalidates the cached result
+    fingerprint = []
+    for file in files:
+        stat = os.stat(os.path.join(gtfs_path, file))
+        fingerprint.append([file, stat.st_mtime_ns, stat.st_size])
+    return fingerprint
+
+
+def _load_cache() -> Dict[str, dict]:
+    try:
+        with open(_cache_path(), encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _store_cache(cache: Dict[str, dict]) -> None:
+    path = _cache_path()
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # write to a temporary file first so readers never see a partial file
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(cache, f)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+    finally:
+        # only left behind when writing or renaming failed
+        if os.path.exists(tmp_path):
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_path)
+
+
+def _scan(gtfs_path: str, filename: str) -> pl.LazyFrame:
+    return pl.scan_csv(
+        os.path.join(gtfs_path, filename),
+        schema_overrides=dict.fromkeys(_STRING_COLUMNS[filename], pl.String),
+    )
+
+
+def _validate_columns(
+    lf: pl.LazyFrame, required_columns: List[str], filename: str
+) -> bool:
+    # column names come from the csv header, no rows are materialized
+    columns = lf.collect_schema().names()
+    if (
+        not all(col in columns for col in required_columns)
+        or lf.limit(1).collect().is_empty()
+    ):
         print(f"{filename} is invalid or missing required columns {required_columns}.")
         return False
     return True
 
 
+def _invalid_time(col: str) -> pl.Expr:
+    # no capture groups, so polars can match with the regex crate's lazy DFA
+    return ~pl.col(col).str.contains(_TIME_PATTERN)
+
+
+def _single_agency(agency_lf: pl.LazyFrame) -> bool:
+    # GTFS allows a blank routes.agency_id when agency.txt defines only one agency
+    return (
+        agency_lf.select((pl.len() == 1) | pl.col("agency_id").is_null().any())
+        .collect()
+        .item()
+    )
+
+
 def _validate_id_rels(
-    df1: pl.DataFrame,
-    col1: str,
-    df2: pl.DataFrame,
-    col2: str,
-    filename1: str,
-    filename2: str,
-):
-    if not set(df1[col1].to_list()).issubset(set(df2[col2].to_list())):
-        print(f"Mismatch in {col1} between {filename1} and {filename2}.")
-        return False
-    return True
+    relations: List[Tuple[pl.LazyFrame, str, pl.LazyFrame, str, str, str, bool]],
+) -> bool:
+    # each (lf1, col1, lf2, col2, filename1, filename2, allow_blank) anti join
+    # counts rows of lf1 without a matching key in lf2, all relations are
+    # collected in one plan. Blank keys never match in a join, so they count as
+    # missing unless allow_blank skips them
+    probes = []
+    for lf1, col1, lf2, col2, _, _, allow_blank in relations:
+        probe = lf1.select(col1)
+        if allow_blank:
+            probe = probe.drop_nulls()
+        probes.append(
+            probe.join(
+                lf2.select(col2).unique(), left_on=col1, right_on=col2, how="anti"
+            ).select(pl.len().alias("missing"))
+        )
+    missing = pl.concat(probes).collect(engine="streaming")["missing"].to_list()
+
+    is_valid = True
+    for (_, col1, _, _, filename1, filename2, _), count in zip(
+        relations, missing, strict=True
+    ):
+        if count:
+            print(f"Mismatch in {col1} between {filename1} and {filename2}.")
+            is_valid = False
+    return is_valid
 
 
 @unstable()
-def validate_feed(gtfs_path: str) -> bool:
+def validate_feed(gtfs_path: str, use_cache: bool = True) -> bool:
     """
     Validates the GTFS feed located at the specified path.
 
@@ -43,9 +153,22 @@ def validate_feed(gtfs_path: str) -> bool:
     relationships between IDs in different files are consistent. Additionally,
     it verifies the format of time columns in the stop_times.txt file.
 
+    Parameters
+    ----------
+    gtfs_path : str
+        Path to the GTFS files.
+    use_cache : bool, optional
+        Whether to read and write the validation cache, by default True.
+
     Notes
     -----
     This operation requires that :mod:`validation` is installed.
+
+    Feeds without any errors are remembered in ``~/.cache/cascade/validate.json``
+    (or ``$XDG_CACHE_HOME/cascade``) by the modification time and size of
+    their files, so validating an unchanged feed again skips reading it.
+    Set ``use_cache=False`` or the ``CASCADE_NO_VALIDATION_CACHE`` environment
+    variable to validate without touching the cache.
     """
 
     if not polars_installed:
@@ -72,44 +195,64 @@ def validate_feed(gtfs_path: str) -> bool:
         warnings.warn("Invalid GTFS path or missing required files.", stacklevel=2)
         return False
 
-    agency_df = pl.read_csv(os.path.join(gtfs_path, "agency.txt"))
-    stops_df = pl.read_csv(os.path.join(gtfs_path, "stops.txt"))
-    routes_df = pl.read_csv(os.path.join(gtfs_path, "routes.txt"))
-    trips_df = pl.read_csv(os.path.join(gtfs_path, "trips.txt"))
-    stop_times_df = pl.read_csv(
-        os.path.join(gtfs_path, "stop_times.txt"), infer_schema_length=10000
-    )
+    use_cache = use_cache and not os.environ.get("CASCADE_NO_VALIDATION_CACHE")
+    if use_cache:
+        feed_key = os.path.abspath(gtfs_path)
+        cache_entry = {
+            "version": _VALIDATOR_VERSION,
+            "files": _feed_fingerprint(gtfs_path, files),
+        }
+        cache = _load_cache()
+        if cache.get(feed_key) == cache_entry:
+            print("GTFS feed is valid.")
+            return True
+
+    # files are scanned lazily, only the columns needed by the checks are read
+    agency_lf = _scan(gtfs_path, "agency.txt")
+    stops_lf = _scan(gtfs_path, "stops.txt")
+    routes_lf = _scan(gtfs_path, "routes.txt")
+    trips_lf = _scan(gtfs_path, "trips.txt")
+    stop_times_lf = _scan(gtfs_path, "stop_times.txt")
+
+    id_relations = [
+        (
+            routes_lf,
+            "agency_id",
+            agency_lf,
+            "agency_id",
+            "routes",
+            "agency",
+            _single_agency(agency_lf),
+        ),
+        (trips_lf, "route_id", routes_lf, "route_id", "trips", "routes", False),
+        (stop_times_lf, "trip_id", trips_lf, "trip_id", "stop_times", "trips", False),
+        (stop_times_lf, "stop_id", stops_lf, "stop_id", "stop_times", "stops", False),
+    ]
 
     critical_errors = not all(
         [
-            _validate_columns(agency_df, ["agency_id"], "agency.txt"),
-            _validate_columns(stops_df, ["stop_id"], "stops.txt"),
-            _validate_columns(routes_df, ["route_id", "agency_id"], "routes.txt"),
-            _validate_columns(trips_df, ["trip_id", "route_id"], "trips.txt"),
+            _validate_columns(agency_lf, ["agency_id"], "agency.txt"),
+            _validate_columns(stops_lf, ["stop_id"], "stops.txt"),
+            _validate_columns(routes_lf, ["route_id", "agency_id"], "routes.txt"),
+            _validate_columns(trips_lf, ["trip_id", "route_id"], "trips.txt"),
             _validate_columns(
-                stop_times_df,
+                stop_times_lf,
                 ["trip_id", "stop_id", "departure_time", "arrival_time"],
                 "stop_times",
             ),
-            _validate_id_rels(
-                routes_df, "agency_id", agency_df, "agency_id", "routes", "agency"
-            ),
-            _validate_id_rels(
-                trips_df, "route_id", routes_df, "route_id", "trips", "routes"
-            ),
-            _validate_id_rels(
-                stop_times_df, "trip_id", trips_df, "trip_id", "stop_times", "trips"
-            ),
-            _validate_id_rels(
-                stop_times_df, "stop_id", stops_df, "stop_id", "stop_times", "stops"
-            ),
+            _validate_id_rels(id_relations),
         ]
     )
 
-    for time_col in ["departure_time", "arrival_time"]:
-        invalid_times = stop_times_df.filter(
-            ~pl.col(time_col).str.contains(r"^(\d{2}):([0-5]\d):([0-5]\d)$")
-        )
+    # single pass over stop_times, rows with any malformed time are kept
+    time_cols = ["departure_time", "arrival_time"]
+    invalid_rows = (
+        stop_times_lf.select(time_cols)
+        .filter(pl.any_horizontal([_invalid_time(col) for col in time_cols]))
+        .collect(engine="streaming")
+    )
+    for time_col in time_cols:
+        invalid_times = invalid_rows.filter(_invalid_time(time_col))
         if not invalid_times.is_empty():
             print(f"Invalid {time_col} format found in stop_times.txt.")
             print(f"Invalid times: {invalid_times[time_col].to_list()}")
@@ -117,5 +260,10 @@ def validate_feed(gtfs_path: str) -> bool:
     if critical_errors:
         print("GTFS feed contains critical errors.")
         return False
+    # only feeds without any errors are cached, the rest are re-checked
+    # to report their errors again
+    if use_cache and invalid_rows.is_empty():
+        cache[feed_key] = cache_entry
+        _store_cache(cache)
     print("GTFS feed is valid.")
     return True
@@ -2,9 +2,11 @@
 This module provides algorithms for finding shortest paths in time-dependent transit graphs. It includes functions to:
 
 - Compute the shortest paths from a source node to all other nodes using Dijkstra's algorithm ([`single_source_shortest_path()`]).
+- Return the same result as columnar `numpy` arrays ([`single_source_shortest_path_weight_ndarray()`]).
 - Find the shortest path weight between a source and target node ([`shortest_path_weight()`]).
 - Retrieve the actual shortest path between a source and target node as a sequence of node indices ([`shortest_path()`]).
 - Calculate an origin-destination (OD) matrix for a set of points, providing the shortest path weights between all pairs of points ([`calculate_od_matrix()`]).
+- Calculate the same OD matrix as a dense `numpy` array ([`calculate_od_matrix_ndarray()`]).
 
 The module also defines a [`PyPoint`] class, a Python wrapper for passing coordinates with an ID to the Rust backend, facilitating seamless integration between Rust and Python components.
 
@@ -38,11 +40,12 @@ print(
 
 use hashbrown::HashMap;
 
+use cascade_core::algo::od_matrix;
 use cascade_core::prelude::*;
 use geo::Point;
+use numpy::{AllowTypeChange, PyArray1, PyArray2, PyArrayLike2, PyArrayMethods};
 use pyo3::prelude::*;
 use pyo3::types::PyString;
-use rayon::prelude::*;
 
 use crate::graph::PyTransitGraph;
 
@@ -66,6 +69,9 @@ use crate::graph::PyTransitGraph;
 ///
 /// Notes
 /// -----
+/// When ``graph.cache_size`` is set, results are cached per graph by snapped source node
+/// and departure time, so repeated queries from the same source skip the Dijkstra search.
+///
 /// This function uses a priority queue to explore the graph with an almost classic Dijkstra's algorithm.
 /// The main difference is that the delay between two nodes is calculated based on the `current time`
 /// and the sorted schedules of the edge.
@@ -83,22 +89,74 @@ use crate::graph::PyTransitGraph;
 ///
 #[pyfunction]
 pub fn single_source_shortest_path_weight(
+    py: Python<'_>,
     graph: &PyTransitGraph,
     dep_time: u32,
     x: f64,
     y: f64,
 ) -> PyResult<HashMap<usize, f64>> {
-    let graph = &graph.graph;
-    let source = snap_point(x, y, graph)?;
+    let source = snap_point(x, y, &graph.graph)?;
+    let distance = *source.distance();
 
-    let hmap = cascade_core::algo::single_source_shortest_path_weight(graph, &source, dep_time)
-        .into_iter()
-        .map(|(k, v)| (k.index(), v))
-        .collect();
+    let hmap = py.allow_threads(|| {
+        graph
+            .node_weights(*source.index(), dep_time)
+            .iter()
+            .map(|(k, v)| (k.index(), v + distance))
+            .collect()
+    });
 
     Ok(hmap)
 }
 
+/// Same as `single_source_shortest_path_weight`, but returns the result as two aligned `numpy` arrays.
+///
+/// Parameters
+/// ----------
+/// graph: PyTransitGraph
+///     The graph to search for the shortest path.
+/// dep_time: int
+///     The starting time.
+/// x: float
+///     Latitude of the source point.
+/// y: float
+///     Longitude of the source point.
+///
+/// Returns
+/// -------
+/// Tuple[numpy.ndarray, numpy.ndarray]
+///     ``int64`` node ids and ``float64`` shortest distances to them.
+///
+/// Notes
+/// -----
+/// The arrays can be wrapped without copying, e.g. with ``pyarrow.array`` or
+/// ``polars.from_numpy``, which avoids creating a Python object per node.
+#[pyfunction]
+#[allow(clippy::cast_possible_wrap)]
+pub fn single_source_shortest_path_weight_ndarray<'py>(
+    py: Python<'py>,
+    graph: &PyTransitGraph,
+    dep_time: u32,
+    x: f64,
+    y: f64,
+) -> PyResult<(Bound<'py, PyArray1<i64>>, Bound<'py, PyArray1<f64>>)> {
+    let source = snap_point(x, y, &graph.graph)?;
+    let distance = *source.distance();
+
+    let (nodes, values): (Vec<i64>, Vec<f64>) = py.allow_threads(|| {
+        graph
+            .node_weights(*source.index(), dep_time)
+            .iter()
+            .map(|(k, v)| (k.index() as i64, v + distance))
+            .unzip()
+    });
+
+    Ok((
+        PyArray1::from_vec(py, nodes),
+        PyArray1::from_vec(py, values),
+    ))
+}
+
 /// Finds the shortest paths from a source node in a time-dependent graph using Dijkstra's algorithm.
 ///
 /// Parameters
@@ -125,6 +183,7 @@ pub fn single_source_shortest_path_weight(
 #[pyfunction]
 #[pyo3(name = "shortest_path_weight")]
 pub fn shortest_path_weight(
+    py: Python<'_>,
     graph: &PyTransitGraph,
     dep_time: u32,
     source_x: f64,
@@ -132,56 +191,144 @@ pub fn shortest_path_weight(
     target_x: f64,
     target_y: f64,
 ) -> PyResult<f64> {
-    let graph = &graph.graph;
+    let source = snap_point(source_x, source_y, &graph.graph)?;
+    let target = snap_point(target_x, target_y, &graph.graph)?;
 
-    let source = snap_point(source_x, source_y, graph)?;
-    let target = snap_point(target_x, target_y, graph)?;
+    let result = py
+        .allow_threads(|| {
+            // reuse a cached single source result if one exists for this source
+            if let Some(weights) = graph.cache.get(*source.index(), dep_time) {
+                return weights
+                    .get(target.index())
+                    .map(|weight| weight + source.distance())
+                    .ok_or_else(|| {
+                        cascade_core::Error::MissingValue(format!(
+                            "failed to extract time for node {:?}",
+                            target.index()
+                        ))
+                    });
+            }
 
-    let result = cascade_core::algo::shortest_path_weight(graph, &source, &target, dep_time)
+            cascade_core::algo::shortest_path_weight(&graph.graph, &source, &target, dep_time)
+        })
         .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(format!("{e:?}")))?;
 
     Ok(result)
 }
 
 /// Calculate an origin-destination (OD) matrix for a set of points, providing the shortest path weights between all pairs of points
+///
+/// Searches run in parallel with the GIL released, so other Python threads keep running meanwhile.
 #[pyfunction]
 pub fn calculate_od_matrix(
+    py: Python<'_>,
     graph: &PyTransitGraph,
     nodes: Vec<PyPoint>,
     dep_time: u32,
 ) -> PyResult<HashMap<String, HashMap<String, f64>>> {
     let graph = &graph.graph;
 
-    let snapped_points: Vec<(String, SnappedPoint)> = nodes
-        .into_iter()
-        .map(|py_point| {
-            snap_point(py_point.x, py_point.y, graph).map(|snapped| (py_point.id, snapped))
-        })
-        .collect::<Result<_, _>>()?;
+    let (ids, snapped_points): (Vec<String>, Vec<SnappedPoint>) =
+        snap_points(nodes, graph)?.into_iter().unzip();
 
-    // Map of node indices to original PyPoint IDs for lookup
-    let id_map: HashMap<usize, &String> = snapped_points
-        .iter()
-        .map(|(id, sn)| (sn.index().index(), id))
-        .collect();
+    if ids.is_empty() {
+        return Ok(HashMap::new());
+    }
 
-    // Collect the OD matrix with PyPoint IDs as keys
-    let od_matrix: HashMap<String, HashMap<String, f64>> = snapped_points
-        .par_iter()
-        .map(|(id, node)| {
-            let mut shortest_paths = HashMap::with_capacity(snapped_points.len());
-            for (k, v) in
-                cascade_core::algo::single_source_shortest_path_weight(graph, node, dep_time)
-            {
-                if let Some(&dest_id) = id_map.get(&k.index()) {
-                    shortest_paths.insert(dest_id.clone(), v); // Directly insert into pre-allocated map
-                }
-            }
-            (id.clone(), shortest_paths)
-        })
+    // Collect the OD matrix with PyPoint IDs as keys, leaving out unreachable pairs
+    let weights_by_id = py.allow_threads(|| {
+        od_matrix(graph, &snapped_points, dep_time, f64::NAN, |weight| weight)
+            .chunks(ids.len())
+            .zip(&ids)
+            .map(|(row, source_id)| {
+                let row = ids
+                    .iter()
+                    .zip(row)
+                    .filter(|(_, weight)| !weight.is_nan())
+                    .map(|(dest_id, weight)| (dest_id.clone(), *weight))
+                    .collect::<HashMap<String, f64>>();
+                (source_id.clone(), row)
+            })
+            .collect()
+    });
+
+    Ok(weights_by_id)
+}
+
+/// Calculate an origin-destination (OD) matrix as a dense `numpy` array.
+///
+/// Parameters
+/// ----------
+/// graph : PyTransitGraph
+///     The graph to search for the shortest paths.
+/// points : numpy.ndarray
+///     Array of shape ``(N, 2)`` with x, y coordinates in EPSG 4326
+///     of the origins and destinations of the matrix. Other array-likes,
+///     such as nested lists or ``float32`` arrays, are converted to ``float64``.
+/// dep_time : int
+///     The departure time in seconds since midnight.
+///
+/// Returns
+/// -------
+/// numpy.ndarray
+///     ``float32`` array of shape ``(N, N)``, where element ``[i, j]`` is the
+///     shortest path weight in seconds from ``points[i]`` to ``points[j]``.
+///     Unreachable pairs are ``NaN``.
+///
+/// Notes
+/// -----
+/// Coordinates are copied out of the array buffer before the GIL is released, without a Python object per point,
+/// so the array may be modified by other threads while the matrix is calculated.
+/// Snapping and searches then run in parallel with the GIL released, so other Python threads keep running meanwhile.
+///
+/// Examples
+/// --------
+/// >>> ids = ["home", "work"]
+/// >>> coords = np.array([[93.528906, 56.245849], [93.554203, 56.237849]])
+/// >>> matrix = calculate_od_matrix_ndarray(graph, coords, 43200)
+/// >>> df = pd.DataFrame(matrix, index=ids, columns=ids)
+#[pyfunction]
+#[allow(clippy::cast_possible_truncation)]
+pub fn calculate_od_matrix_ndarray<'py>(
+    py: Python<'py>,
+    graph: &PyTransitGraph,
+    points: PyArrayLike2<'py, f64, AllowTypeChange>,
+    dep_time: u32,
+) -> PyResult<Bound<'py, PyArray2<f32>>> {
+    let graph = &graph.graph;
+    let points = points.as_array();
+
+    if points.ncols() != 2 {
+        return Err(pyo3::exceptions::PyValueError::new_err(format!(
+            "points must have shape (N, 2), got {:?}",
+            points.shape()
+        )));
+    }
+
+    // the array buffer must not be read once the GIL is released
+    let coords: Vec<(f64, f64)> = points
+        .rows()
+        .into_iter()
+        .map(|point| (point[0], point[1]))
         .collect();
 
-    Ok(od_matrix)
+    let matrix: Vec<f32> = py.allow_threads(|| {
+        let snapped_points: Vec<SnappedPoint> = coords
+            .iter()
+            .map(|&(x, y)| snap_point(x, y, graph))
+            .collect::<Result<_, _>>()?;
+
+        Ok::<_, PyErr>(od_matrix(
+            graph,
+            &snapped_points,
+            dep_time,
+            f32::NAN,
+            |weight| weight as f32,
+        ))
+    })?;
+
+    let n = coords.len();
+    PyArray1::from_vec(py, matrix).reshape([n, n])
 }
 
 pub(crate) fn snap_point(x: f64, y: f64, graph: &TransitGraph) -> PyResult<SnappedPoint> {
@@ -190,6 +337,19 @@ pub(crate) fn snap_point(x: f64, y: f64, graph: &TransitGraph) -> PyResult<Snapp
     })
 }
 
+/// Snap every `PyPoint` to the graph, keeping its id alongside the snapped point.
+pub(crate) fn snap_points(
+    points: Vec<PyPoint>,
+    graph: &TransitGraph,
+) -> PyResult<Vec<(String, SnappedPoint)>> {
+    points
+        .into_iter()
+        .map(|py_point| {
+            snap_point(py_point.x, py_point.y, graph).map(|snapped| (py_point.id, snapped))
+        })
+        .collect()
+}
+
 /// Spatial point with ID and x, y coords.
 ///    Required to correctly pass data across Rust/Python ffi boundary
 #[pyclass(get_all)]
@@ -15,15 +15,22 @@ This module provides functionality to:
 - [`PyGraphNode`]: A class representing individual nodes in the graph, containing information like node type (transit or street), identifier, and geometry.
 */
 
+use std::collections::BTreeMap;
+use std::sync::{Arc, Mutex};
+
 use hashbrown::HashMap;
 
 use cascade_core::graph::GraphNode;
 use cascade_core::prelude::*;
 
 use geo::Point;
+use petgraph::graph::NodeIndex;
 use pyo3::prelude::*;
 use pyo3::types::PyString;
 
+/// Single source shortest path weights from a graph node, without the snapping distance.
+pub(crate) type NodeWeights = Arc<HashMap<NodeIndex, f64>>;
+
 /// Creates a `PyTransitGraph` based on GTFS and OpenStreetMap data.
 ///
 /// Parameters
@@ -62,20 +69,146 @@ pub fn create_graph(
         duration,
         weekday,
     };
-    let instant = std::time::Instant::now();
+    let instant = crate::profiling_enabled().then(std::time::Instant::now);
     let graph = TransitGraph::from(feed_args).map_err(|e| {
         pyo3::exceptions::PyRuntimeError::new_err(format!("Graph creation failed: {e:?}"))
     })?;
 
-    println!("Graph creation time: {:?}", instant.elapsed());
+    if let Some(instant) = instant {
+        println!("Graph creation time: {:?}", instant.elapsed());
+    }
+
+    Ok(PyTransitGraph::new(graph))
+}
+
+/// LRU cache of single source Dijkstra results keyed by source node and departure time.
+/// Repeated queries from the same source (e.g. batch OD workloads) reuse the stored weights.
+/// Each entry holds weights for every reachable node, so the cache is disabled
+/// (zero capacity) unless a size is set explicitly.
+#[derive(Default)]
+pub(crate) struct ShortestPathCache {
+    inner: Mutex<CacheInner>,
+}
+
+#[derive(Default)]
+struct CacheInner {
+    /// Weights with the tick of their last use
+    entries: HashMap<(NodeIndex, u32), (NodeWeights, u64)>,
+    /// Keys by the tick of their last use, least recently used first
+    recency: BTreeMap<u64, (NodeIndex, u32)>,
+    /// Incremented on every use, so ticks are unique
+    tick: u64,
+    /// Maximum number of entries, `0` disables caching
+    capacity: usize,
+}
+
+impl CacheInner {
+    fn next_tick(&mut self) -> u64 {
+        self.tick += 1;
+        self.tick
+    }
 
-    Ok(PyTransitGraph { graph })
+    fn evict_to(&mut self, len: usize) {
+        while self.entries.len() > len {
+            let Some((_, oldest)) = self.recency.pop_first() else {
+                break;
+            };
+            self.entries.remove(&oldest);
+        }
+    }
+}
+
+impl ShortestPathCache {
+    pub(crate) fn capacity(&self) -> usize {
+        self.inner.lock().map_or(0, |inner| inner.capacity)
+    }
+
+    /// Sets the maximum number of entries, evicting the least recently used ones beyond it.
+    pub(crate) fn set_capacity(&self, capacity: usize) {
+        if let Ok(mut inner) = self.inner.lock() {
+            inner.capacity = capacity;
+            inner.evict_to(capacity);
+        }
+    }
+
+    pub(crate) fn get(&self, source: NodeIndex, dep_time: u32) -> Option<NodeWeights> {
+        let mut guard = self.inner.lock().ok()?;
+        let inner = &mut *guard;
+        let key = (source, dep_time);
+        let tick = inner.next_tick();
+
+        let (weights, last_used) = inner.entries.get_mut(&key)?;
+        inner.recency.remove(&*last_used);
+        *last_used = tick;
+        let weights = Arc::clone(weights);
+
+        inner.recency.insert(tick, key);
+        Some(weights)
+    }
+
+    pub(crate) fn insert(&self, source: NodeIndex, dep_time: u32, weights: NodeWeights) {
+        let Ok(mut inner) = self.inner.lock() else {
+            return;
+        };
+        if inner.capacity == 0 {
+            return;
+        }
+        let key = (source, dep_time);
+        let tick = inner.next_tick();
+
+        if let Some((_, last_used)) = inner.entries.insert(key, (weights, tick)) {
+            inner.recency.remove(&last_used);
+        }
+        inner.recency.insert(tick, key);
+        let capacity = inner.capacity;
+        inner.evict_to(capacity);
+    }
+
+    pub(crate) fn clear(&self) {
+        if let Ok(mut inner) = self.inner.lock() {
+            inner.entries.clear();
+            inner.recency.clear();
+        }
+    }
 }
 
 /// Multimodal graph of transit system, implemented with `PetGraph`
+///
+/// Routing functions release the GIL while they search the graph, so several
+/// threads can query one graph at once. The graph stays borrowed for the whole
+/// search: calling `extend_with_transit` meanwhile raises
+/// ``RuntimeError: Already borrowed``. Finish or synchronize the queries
+/// before extending the graph.
 #[pyclass]
 pub struct PyTransitGraph {
     pub graph: TransitGraph,
+    pub(crate) cache: ShortestPathCache,
+}
+
+impl PyTransitGraph {
+    #[must_use]
+    pub fn new(graph: TransitGraph) -> Self {
+        Self {
+            graph,
+            cache: ShortestPathCache::default(),
+        }
+    }
+
+    /// Single source Dijkstra weights from `source`, served from the cache when possible.
+    pub(crate) fn node_weights(&self, source: NodeIndex, dep_time: u32) -> NodeWeights {
+        if let Some(weights) = self.cache.get(source, dep_time) {
+            return weights;
+        }
+
+        let weights = Arc::new(cascade_core::algo::dijkstra::time_dependent_dijkstra(
+            &self.graph,
+            source,
+            None,
+            dep_time,
+        ));
+        self.cache.insert(source, dep_time, Arc::clone(&weights));
+        weights
+    }
 }
 
 #[pymethods]
@@ -89,6 +222,27 @@ impl PyTransitGraph {
         ))
     }
 
+    /// Maximum number of single source shortest path results cached by the graph.
+    ///
+    /// Each result holds the weights of every reachable node, so memory grows with
+    /// both the cache size and the graph size. Defaults to ``0``, which disables caching.
+    /// Lowering the size evicts the least recently used results.
+    #[getter]
+    #[must_use]
+    pub fn get_cache_size(&self) -> usize {
+        self.cache.capacity()
+    }
+
+    #[setter]
+    pub fn set_cache_size(&self, size: usize) {
+        self.cache.set_capacity(size);
+    }
+
+    /// Drop all cached shortest path results.
+    pub fn clear_cache(&self) {
+        self.cache.clear();
+    }
+
     /// Get mapping of graph raw node ids to `PyGraphNode` objects.
     #[must_use]
     #[allow(clippy::missing_panics_doc)] // panic impossible
@@ -137,6 +291,12 @@ impl PyTransitGraph {
     /// Returns
     /// -------
     /// None
+    ///
+    /// Raises
+    /// ------
+    /// RuntimeError
+    ///     ``Already borrowed`` if another thread is querying the graph
+    ///     at the same time.
     pub fn extend_with_transit(
         &mut self,
         gtfs_path: &str,
@@ -160,6 +320,8 @@ impl PyTransitGraph {
         self.graph.extend_with_transit(&feed_args).map_err(|e| {
             pyo3::exceptions::PyRuntimeError::new_err(format!("Graph creation failed: {e:?}"))
         })?;
+        // cached weights are stale once new transit edges are added
+        self.cache.clear();
 
         Ok(())
     }
@@ -219,3 +381,60 @@ impl PyGraphNode {
         self.geometry.y()
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn weights(weight: f64) -> NodeWeights {
+        Arc::new(HashMap::from([(NodeIndex::new(0), weight)]))
+    }
+
+    #[test]
+    fn test_cache_disabled_by_default() {
+        let cache = ShortestPathCache::default();
+        cache.insert(NodeIndex::new(1), 0, weights(1.0));
+
+        assert_eq!(cache.capacity(), 0);
+        assert!(cache.get(NodeIndex::new(1), 0).is_none());
+    }
+
+    #[test]
+    fn test_cache_evicts_least_recently_used() {
+        let cache = ShortestPathCache::default();
+        cache.set_capacity(2);
+
+        cache.insert(NodeIndex::new(1), 0, weights(1.0));
+        cache.insert(NodeIndex::new(2), 0, weights(2.0));
+        // reading the first entry makes the second one the oldest
+        assert!(cache.get(NodeIndex::new(1), 0).is_some());
+        cache.insert(NodeIndex::new(3), 0, weights(3.0));
+
+        assert!(cache.get(NodeIndex::new(2), 0).is_none());
+        assert!(cache.get(NodeIndex::new(1), 0).is_some());
+        assert!(cache.get(NodeIndex::new(3), 0).is_some());
+
+        // the departure time is part of the key
+        assert!(cache.get(NodeIndex::new(3), 60).is_none());
+    }
+
+    #[test]
+    fn test_cache_reinsert_and_shrink() {
+        let cache = ShortestPathCache::default();
+        cache.set_capacity(3);
+
+        cache.insert(NodeIndex::new(1), 0, weights(1.0));
+        cache.insert(NodeIndex::new(2), 0, weights(2.0));
+        cache.insert(NodeIndex::new(3), 0, weights(3.0));
+        // replacing an entry refreshes it instead of evicting another one
+        cache.insert(NodeIndex::new(1), 0, weights(10.0));
+
+        let first = cache.get(NodeIndex::new(1), 0).unwrap();
+        assert_eq!(first.get(&NodeIndex::new(0)), Some(&10.0));
+
+        cache.set_capacity(1);
+        assert!(cache.get(NodeIndex::new(2), 0).is_none());
+        assert!(cache.get(NodeIndex::new(3), 0).is_none());
+        assert!(cache.get(NodeIndex::new(1), 0).is_some());
+    }
+}
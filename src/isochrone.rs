@@ -1,11 +1,11 @@
 use pyo3::prelude::*;
 
-use crate::algo::{snap_point, PyPoint};
+use crate::algo::{snap_point, snap_points, PyPoint};
 use crate::graph::PyTransitGraph;
-use cascade_core::prelude::*;
 
 #[pyfunction]
 pub fn calculate_isochrone(
+    py: Python<'_>,
     graph: &PyTransitGraph,
     source_x: f64,
     source_y: f64,
@@ -16,20 +16,24 @@ pub fn calculate_isochrone(
     let graph = &graph.graph;
     let source = snap_point(source_x, source_y, graph)?;
 
-    let result = cascade_core::algo::isochrone::calculate_isochrone(
-        graph,
-        &source,
-        dep_time,
-        cutoff,
-        buffer_radius,
-    )
-    .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(format!("{e:?}")))?;
+    let result = py
+        .allow_threads(|| {
+            cascade_core::algo::isochrone::calculate_isochrone(
+                graph,
+                &source,
+                dep_time,
+                cutoff,
+                buffer_radius,
+            )
+        })
+        .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(format!("{e:?}")))?;
 
     Ok(result)
 }
 
 #[pyfunction]
 pub fn bulk_isochrones(
+    py: Python<'_>,
     graph: &PyTransitGraph,
     sources: Vec<PyPoint>,
     start_time: u32,
@@ -38,21 +42,19 @@ pub fn bulk_isochrones(
 ) -> PyResult<String> {
     let graph = &graph.graph;
 
-    let snapped_points: Vec<(String, SnappedPoint)> = sources
-        .into_iter()
-        .map(|py_point| {
-            snap_point(py_point.x, py_point.y, graph).map(|snapped| (py_point.id, snapped))
+    let snapped_points = snap_points(sources, graph)?;
+
+    let isochrones = py
+        .allow_threads(|| {
+            cascade_core::algo::bulk_isochrones(
+                graph,
+                &snapped_points,
+                start_time,
+                cutoff,
+                buffer_radius,
+            )
         })
-        .collect::<Result<_, _>>()?;
-
-    let isochrones = cascade_core::algo::bulk_isochrones(
-        graph,
-        &snapped_points,
-        start_time,
-        cutoff,
-        buffer_radius,
-    )
-    .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(format!("{e:?}")))?;
+        .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(format!("{e:?}")))?;
 
     let collection = geojson::ser::to_feature_collection_string(&isochrones)
         .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(format!("{e:?}")))?;
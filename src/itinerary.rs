@@ -34,6 +34,7 @@ use crate::graph::PyTransitGraph;
 ///     Itinerary in GeoJSON format.
 #[pyfunction]
 pub fn detailed_itinerary(
+    py: Python<'_>,
     graph: &PyTransitGraph,
     dep_time: u32,
     source_x: f64,
@@ -47,8 +48,11 @@ pub fn detailed_itinerary(
     let source = snap_point(source_x, source_y, graph)?;
     let target = snap_point(target_x, target_y, graph)?;
 
-    let itinerary =
-        cascade_core::algo::detailed_itinerary(graph, &source, &target, dep_time, wheelchair);
+    let itinerary = py.allow_threads(|| {
+        cascade_core::algo::detailed_itinerary(graph, &source, &target, dep_time, wheelchair)
+            .to_geojson()
+            .to_string()
+    });
 
-    Ok(itinerary.to_geojson().to_string())
+    Ok(itinerary)
 }
@@ -43,10 +43,13 @@ graph = create_graph(gtfs_path, pbf_path, departure, duration, weekday)
 ```
 */
 
+use std::sync::OnceLock;
+
 use pyo3::prelude::*;
 
 use crate::algo::{
-    calculate_od_matrix, shortest_path_weight, single_source_shortest_path_weight, PyPoint,
+    calculate_od_matrix, calculate_od_matrix_ndarray, shortest_path_weight,
+    single_source_shortest_path_weight, single_source_shortest_path_weight_ndarray, PyPoint,
 };
 use crate::graph::{create_graph, PyTransitGraph};
 use crate::isochrone::{bulk_isochrones, calculate_isochrone};
@@ -57,11 +60,23 @@ pub mod graph;
 pub mod isochrone;
 pub mod itinerary;
 
+/// Whether timing output is enabled via the `CASCADE_PROFILE` environment variable.
+/// Resolved once per process.
+pub(crate) fn profiling_enabled() -> bool {
+    static ENABLED: OnceLock<bool> = OnceLock::new();
+    *ENABLED.get_or_init(|| std::env::var_os("CASCADE_PROFILE").is_some())
+}
+
 #[pymodule]
 fn _cascade_core(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_function(wrap_pyfunction!(single_source_shortest_path_weight, m)?)?;
+    m.add_function(wrap_pyfunction!(
+        single_source_shortest_path_weight_ndarray,
+        m
+    )?)?;
     m.add_function(wrap_pyfunction!(shortest_path_weight, m)?)?;
     m.add_function(wrap_pyfunction!(calculate_od_matrix, m)?)?;
+    m.add_function(wrap_pyfunction!(calculate_od_matrix_ndarray, m)?)?;
 
     m.add_function(wrap_pyfunction!(detailed_itinerary, m)?)?;
 
@@ -1,11 +1,10 @@
-use cascade_core::algo::detailed_itinerary;
+use cascade_core::algo::{detailed_itinerary, od_matrix};
+use cascade_core::graph::GraphNode;
 use cascade_core::prelude::*;
 use geo::Point;
 use std::path::PathBuf;
 
-#[allow(clippy::cast_possible_truncation)]
-#[test]
-fn main_zheleznogorsk_test() {
+fn zheleznogorsk_graph() -> TransitGraph {
     let gtfs_path: PathBuf = "tests/test_data/Zhelez".into();
     let pbf_path: PathBuf = "tests/test_data/roads_zhelez.pbf".into();
 
@@ -16,9 +15,15 @@ fn main_zheleznogorsk_test() {
         duration: 90000,
         weekday: "monday",
     };
-    let departure_time = 43200;
 
-    let transit_graph = TransitGraph::from(feed_args).expect("Failed to construct Transit Graph");
+    TransitGraph::from(feed_args).expect("Failed to construct Transit Graph")
+}
+
+#[allow(clippy::cast_possible_truncation)]
+#[test]
+fn main_zheleznogorsk_test() {
+    let departure_time = 43200;
+    let transit_graph = zheleznogorsk_graph();
 
     let source = SnappedPoint::init(Point::new(93.528906, 56.245849), &transit_graph)
         .expect("Failed to concstruct snapped point");
@@ -39,3 +44,48 @@ fn main_zheleznogorsk_test() {
         }
     ));
 }
+
+#[allow(clippy::cast_possible_truncation)]
+#[test]
+fn od_matrix_shared_snap_node_test() {
+    let departure_time = 43200;
+    let transit_graph = zheleznogorsk_graph();
+
+    let source = SnappedPoint::init(Point::new(93.528906, 56.245849), &transit_graph)
+        .expect("Failed to concstruct snapped point");
+    // a point right on the snapped walk node shares it from another distance
+    let GraphNode::Walk(node) = &transit_graph[*source.index()] else {
+        panic!("Points should snap to walk nodes");
+    };
+
+    let points: Vec<SnappedPoint> = [
+        Point::new(93.528906, 56.245849),
+        Point::new(93.554203, 56.237849),
+        node.geometry,
+    ]
+    .into_iter()
+    .map(|point| {
+        SnappedPoint::init(point, &transit_graph).expect("Failed to concstruct snapped point")
+    })
+    .collect();
+    assert_eq!(points[0].index(), points[2].index());
+
+    let n = points.len();
+    let matrix = od_matrix(&transit_graph, &points, departure_time, f64::NAN, |w| w);
+    assert_eq!(matrix.len(), n * n);
+
+    let weight = |source: usize, target: usize| matrix[source * n + target];
+    assert_eq!(weight(0, 1) as i32, 1121);
+
+    // rows follow the input order: the diagonal is the own snapping distance
+    assert!((weight(0, 0) - points[0].distance()).abs() < 1e-9);
+    assert!((weight(2, 2) - points[2].distance()).abs() < 1e-9);
+
+    let offset = points[2].distance() - points[0].distance();
+    for target in 0..n {
+        // rows of the shared node differ only by the snapping distance
+        assert!((weight(2, target) - weight(0, target) - offset).abs() < 1e-9);
+        // columns of the shared node hold the same weights
+        assert!((weight(target, 2) - weight(target, 0)).abs() < 1e-9);
+    }
+}